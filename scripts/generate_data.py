@@ -1,23 +1,57 @@
 import firebase_admin
 from firebase_admin import credentials, firestore
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date, datetime, timedelta
 import random
 import argparse
 import os
 import json
+import re
+import statistics
+import string
+import time
+import unicodedata
+
+def positive_int(value):
+    """argparse type for options that must be a whole number of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a whole number")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} must be at least 1")
+    return number
 
 # Parse command-line arguments
 parser = argparse.ArgumentParser(description='Add or clear dummy data in Firebase')
 parser.add_argument('--estate_id', type=str, help='The ID of the estate to add data to')
-parser.add_argument('--action', type=str, choices=['add', 'clear'], default='add', help='Action to perform (add or clear data)')
-parser.add_argument('--type', type=str, choices=['all', 'transactions', 'notices', 'members', 'estates'], default='all', 
-                    help='Type of data to generate (default: all)')
+parser.add_argument('--action', type=str, choices=['add', 'clear', 'benchmark'], default='add',
+                    help='Action to perform (add or clear data, or benchmark reads)')
+parser.add_argument('--type', type=str, choices=['all', 'transactions', 'notices', 'members', 'estates', 'search_index'],
+                    default='all', help='Type of data to generate (default: all)')
 parser.add_argument('--count', type=int, default=0, 
                     help='Number of items to generate (default: 25 for members, 10 for notices, all transaction types)')
 parser.add_argument('--estates_count', type=int, default=3, 
                     help='Number of estates to generate when generating estates (default: 3)')
 parser.add_argument('--credentials_path', type=str, 
                     help='Path to Firebase credentials JSON file (alternatively, use FIREBASE_CREDENTIALS_PATH env variable)')
+parser.add_argument('--scenario', type=str,
+                    help='Path to a YAML or JSON scenario file describing estates and their data to generate')
+parser.add_argument('--concurrency', type=positive_int,
+                    help='Maximum number of concurrent batch writes when running a scenario (default: scenario value or 8)')
+parser.add_argument('--unique_names', action='store_true',
+                    help='Give every generated estate a distinct name and location (supports up to 100k+ estates)')
+parser.add_argument('--queries', type=str, default='oak,park,dublin,north green,galway',
+                    help='Comma-separated search queries for --action benchmark --type estates')
+parser.add_argument('--repeats', type=positive_int, default=3,
+                    help='Number of times to repeat each benchmark run (default: 3)')
+parser.add_argument('--timeline', action='store_true',
+                    help='Generate notices as a bursty timeline spanning --start_date to --end_date')
+parser.add_argument('--start_date', type=str,
+                    help='Start date (YYYY-MM-DD) for notice timelines (default: two years before --end_date)')
+parser.add_argument('--end_date', type=str, help='End date (YYYY-MM-DD) for notice timelines (default: now)')
+parser.add_argument('--page_size', type=positive_int, default=20,
+                    help='Page size for --action benchmark --type notices (default: 20)')
 args = parser.parse_args()
 
 # Initialize Firebase
@@ -69,6 +103,32 @@ db = firestore.client()
 # Estate ID from command line
 estate_id = args.estate_id
 
+###############################################
+# HELPERS
+###############################################
+
+# Default number of concurrent batch writes
+DEFAULT_CONCURRENCY = 8
+
+def parse_date(value):
+    """Parse a date from a scenario file or the command line (date, datetime or ISO string)"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+def random_time_between(start, end):
+    """Return a random datetime between start and end"""
+    return start + timedelta(seconds=random.uniform(0, (end - start).total_seconds()))
+
+def summarize_latencies(latencies):
+    """Format min/median/p95/max of a list of latencies in seconds as milliseconds"""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"min {ordered[0] * 1000:.1f}ms, median {statistics.median(ordered) * 1000:.1f}ms, "
+            f"p95 {p95 * 1000:.1f}ms, max {ordered[-1] * 1000:.1f}ms")
+
 ###############################################
 # MEMBERS
 ###############################################
@@ -128,8 +188,8 @@ def generate_dummy_members(count=25):
         email = f"{email_base}@example.com"
         
         # Ensure email is unique; if not, add a number
-        if email in used_emails:
-            email = f"{email_base}{random.randint(1, 999)}@example.com"
+        while email in used_emails:
+            email = f"{email_base}{random.randint(1, 9999)}@example.com"
         used_emails.add(email)
         
         # Assign a role based on weighted probabilities
@@ -279,8 +339,8 @@ def clear_notices():
         print(f"Error clearing notices: {e}")
         return 0
 
-def generate_dummy_notices(count=10):
-    """Generate a list of dummy notices"""
+def generate_dummy_notices(count=10, start=None, end=None):
+    """Generate a list of dummy notices, optionally spread across a date range"""
     notices = []
     now = datetime.now()
     
@@ -296,10 +356,13 @@ def generate_dummy_notices(count=10):
     
     # Generate notices from templates
     for template in templates_to_use[:count]:
-        # Generate a random timestamp within the last 30 days
-        random_days = random.randint(0, 30)
-        random_seconds = random.randint(0, 86400)  # Number of seconds in a day
-        random_time = now - timedelta(days=random_days, seconds=random_seconds)
+        if start and end:
+            random_time = random_time_between(start, end)
+        else:
+            # Generate a random timestamp within the last 30 days
+            random_days = random.randint(0, 30)
+            random_seconds = random.randint(0, 86400)  # Number of seconds in a day
+            random_time = now - timedelta(days=random_days, seconds=random_seconds)
         
         # Create a notice from the template
         notice = template.copy()
@@ -312,6 +375,243 @@ def generate_dummy_notices(count=10):
     
     return notices
 
+# Building blocks for synthesizing notice text. Each topic has an opening notice and, for
+# incidents and events, follow-ups that are posted in a burst after it.
+NOTICE_FACILITIES = ["water supply", "lifts", "car park gates", "community pool", "gym", "heating system",
+                     "main entrance intercom", "bin store", "playground", "CCTV system", "street lighting"]
+NOTICE_AREAS = ["Block A", "Block B", "Block C", "the courtyard", "the east car park", "the west car park",
+                "the community centre", "Phase 2", "the main entrance", "the green"]
+NOTICE_EVENTS = ["Community BBQ", "Coffee Morning", "Clean-up Day", "Kids' Movie Night", "Residents' Quiz",
+                 "Summer Fair", "Christmas Party", "Gardening Workshop"]
+NOTICE_DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+NOTICE_TIMES = ["8 AM", "9 AM", "10 AM", "11 AM", "1 PM", "2 PM", "4 PM", "6 PM", "7 PM", "8 PM"]
+NOTICE_CLOSERS = ["Thank you for your patience.", "We apologize for any inconvenience.",
+                  "Please contact the management office with any questions.", "Thank you for your cooperation.",
+                  "", ""]
+
+# Follow-ups are posted "soon" after the previous notice (incident updates), or the day
+# "before" / "after" the date the topic is scheduled for ({day} in the text).
+NOTICE_TOPICS = [
+    {
+        "type": "urgent",
+        "notices": [("{Facility} Outage",
+                     "The {facility} serving {area} is currently out of service. Engineers have been called out."),
+                    ("{Facility} Out of Service",
+                     "We are aware of a fault with the {facility} in {area} and are working to fix it.")],
+        "follow_ups": [
+            {"when": "soon", "notices": [
+                ("Update: {Facility} Outage",
+                 "Engineers are on site in {area} working on the {facility}. We will post another update soon."),
+                ("Update: {Facility} Outage",
+                 "Repairs to the {facility} are taking longer than expected. We expect it back by {time}.")]},
+            {"when": "soon", "notices": [
+                ("Resolved: {Facility} Outage", "The {facility} in {area} is working again.")]},
+        ],
+    },
+    {
+        "type": "urgent",
+        "notices": [("Security Alert: {Area}",
+                     "Residents have reported suspicious activity near {area}. Please keep doors and gates locked."),
+                    ("Suspicious Activity near {Area}",
+                     "There was an attempted break-in near {area} last night. Please report anything unusual.")],
+        "follow_ups": [
+            {"when": "soon", "notices": [
+                ("Update: Security Alert", "The Gardaí have been informed about the incident near {area}."),
+                ("Update: Security Alert", "Extra patrols have been arranged around {area} this week.")]},
+        ],
+    },
+    {
+        "type": "general",
+        "notices": [("Scheduled {Facility} Maintenance",
+                     "Contractors will service the {facility} in {area} on {day} from {time}."),
+                    ("{Facility} Works on {day}",
+                     "Planned works on the {facility} will take place on {day} starting at {time}.")],
+        "follow_ups": [
+            {"when": "before", "notices": [
+                ("Reminder: {Facility} Maintenance",
+                 "A reminder that the {facility} works in {area} start on {day} at {time}.")]},
+        ],
+    },
+    {
+        "type": "event",
+        "notices": [("{event} on {day}",
+                     "Join us for the {event} in {area} on {day} at {time}. Everyone is welcome!"),
+                    ("Join Us: {event}",
+                     "The {event} takes place on {day} at {time} in {area}. Bring the whole family.")],
+        "follow_ups": [
+            {"when": "before", "notices": [
+                ("Reminder: {event}", "Don't forget the {event} this {day} at {time} in {area}.")]},
+            {"when": "after", "notices": [
+                ("Thank You: {event}", "Thanks to everyone who came to the {event}. See you at the next one!")]},
+        ],
+    },
+    {
+        "type": "general",
+        "notices": [("Residents' Meeting on {day}",
+                     "The residents' meeting will be held on {day} at {time} in {area}. All residents are welcome."),
+                    ("Management Company Update",
+                     "The management company has published its quarterly update. Copies are available in {area}.")],
+        "follow_ups": [],
+    },
+    {
+        "type": "general",
+        "notices": [("Parking Reminder for {Area}",
+                     "Please do not park in front of the gates at {area}. Vehicles blocking access may be clamped."),
+                    ("Bin Collection Changes",
+                     "Bin collection will move to {day} mornings from next week. Please leave bins out by {time}.")],
+        "follow_ups": [],
+    },
+]
+
+# Relative notice activity by hour of day (0-23) and by weekday (Monday first)
+NOTICE_HOUR_WEIGHTS = [0.1, 0.05, 0.05, 0.05, 0.05, 0.1, 0.3, 0.6, 0.9, 1.0, 1.0, 1.0,
+                       0.9, 0.9, 0.9, 0.9, 0.9, 1.0, 1.0, 0.9, 0.8, 0.6, 0.4, 0.2]
+NOTICE_WEEKDAY_WEIGHTS = [1.0, 1.0, 1.0, 1.0, 0.9, 0.5, 0.4]
+
+def _title_case(text):
+    """Capitalize each word, leaving acronyms such as CCTV alone"""
+    return " ".join(word if word.isupper() else word.capitalize() for word in text.split())
+
+def _synthesize_notice_text(variants, slots):
+    title, message = random.choice(variants)
+    message = " ".join(filter(None, [message.format(**slots), random.choice(NOTICE_CLOSERS)]))
+    return title.format(**slots), message
+
+def _is_active(moment, growth=1.0):
+    weight = NOTICE_HOUR_WEIGHTS[moment.hour] * NOTICE_WEEKDAY_WEIGHTS[moment.weekday()] * growth
+    return random.random() < weight
+
+def _next_active_time(moment):
+    """Move a time forward hour by hour until it is accepted by the hour and weekday weights"""
+    while not _is_active(moment):
+        moment += timedelta(hours=1)
+    return moment
+
+def _random_active_time(start, end):
+    """Sample a time between start and end, favouring daytime, weekdays and later dates (a growing estate)"""
+    while True:
+        candidate = random_time_between(start, end)
+        growth = 0.5 + 0.5 * (candidate - start) / (end - start)
+        if _is_active(candidate, growth):
+            return candidate
+
+def generate_notice_timeline(count, start, end, burstiness=0.4):
+    """Generate a bursty timeline of notices between start and end, newest first.
+    
+    With probability `burstiness`, an incident, works or event notice starts a thread: updates
+    posted within hours (incidents), or reminders and thank-yous around the scheduled day.
+    Everything else is a standalone notice. All notices are pushed into active hours.
+    """
+    notices = []
+    
+    def add_notice(title, message, notice_type, created_at):
+        notices.append({
+            "title": title,
+            "message": message,
+            "type": notice_type,
+            "likedBy": [],
+            "metadata": {
+                "createdAt": created_at,
+                "updatedAt": created_at
+            }
+        })
+    
+    while len(notices) < count:
+        topic = random.choice(NOTICE_TOPICS)
+        facility = random.choice(NOTICE_FACILITIES)
+        area = random.choice(NOTICE_AREAS)
+        slots = {
+            "facility": facility, "Facility": _title_case(facility),
+            "area": area, "Area": _title_case(area),
+            "event": random.choice(NOTICE_EVENTS), "time": random.choice(NOTICE_TIMES),
+        }
+        created_at = _random_active_time(start, end)
+        # The date the notice announces (works, events, meetings), a few days after it is posted
+        scheduled_at = created_at + timedelta(days=random.randint(3, 10))
+        slots["day"] = NOTICE_DAYS[scheduled_at.weekday()]
+        
+        add_notice(*_synthesize_notice_text(topic["notices"], slots), topic["type"], created_at)
+        if not topic["follow_ups"] or random.random() > burstiness:
+            continue
+        
+        posted_at = created_at
+        for index, follow_up in enumerate(topic["follow_ups"]):
+            # Incident updates can repeat, but a thread only ever has one closing notice
+            last = index == len(topic["follow_ups"]) - 1
+            repeats = random.randint(1, 3) if follow_up["when"] == "soon" and not last else 1
+            for _ in range(repeats):
+                if follow_up["when"] == "soon":
+                    posted_at += timedelta(hours=2) * random.expovariate(1.0)
+                elif follow_up["when"] == "before":
+                    posted_at = scheduled_at - timedelta(hours=random.uniform(12, 36))
+                else:
+                    posted_at = scheduled_at + timedelta(hours=random.uniform(12, 48))
+                posted_at = _next_active_time(posted_at)
+                if posted_at > end or len(notices) >= count:
+                    break
+                add_notice(*_synthesize_notice_text(follow_up["notices"], slots), topic["type"], posted_at)
+    
+    notices.sort(key=lambda notice: notice["metadata"]["createdAt"], reverse=True)
+    return notices
+
+def add_notice_timeline(count, start, end, concurrency=DEFAULT_CONCURRENCY):
+    """Add a bursty notice timeline to Firestore using batched writes"""
+    try:
+        collection_path = f"estates/{estate_id}/notices"
+        notices = generate_notice_timeline(count, start, end)
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            written, _ = drain_batches(commit_batches(collection_path, [(None, n) for n in notices], executor))
+        
+        print(f"Successfully added {written} timeline notices from {start:%Y-%m-%d} to {end:%Y-%m-%d} "
+              f"to estate {estate_id}!")
+        return written
+    except Exception as e:
+        print(f"Error adding notice timeline: {e}")
+        return 0
+
+def benchmark_notice_pagination(page_size=20, repeats=1):
+    """Walk every notice newest first with start_after cursors, as the app pages through notices"""
+    try:
+        collection_path = f"estates/{estate_id}/notices"
+        query = db.collection(collection_path).order_by("metadata.createdAt", direction=firestore.Query.DESCENDING)
+        
+        for run in range(repeats):
+            latencies = []
+            notices_read = 0
+            reads = 0
+            last_doc = None
+            started = time.perf_counter()
+            
+            while True:
+                page_query = query.limit(page_size)
+                if last_doc is not None:
+                    page_query = page_query.start_after(last_doc)
+                
+                page_started = time.perf_counter()
+                docs = list(page_query.stream())
+                latencies.append(time.perf_counter() - page_started)
+                
+                notices_read += len(docs)
+                reads += max(1, len(docs))  # Firestore bills at least one read per query
+                if len(docs) < page_size:
+                    break
+                last_doc = docs[-1]
+            
+            elapsed = time.perf_counter() - started
+            print(f"\nRun {run + 1}: {notices_read} notices in {len(latencies)} pages of {page_size} "
+                  f"({reads} reads, {elapsed:.2f}s)")
+            print(f"  All pages:      {summarize_latencies(latencies)}")
+            print(f"  First 10 pages: {summarize_latencies(latencies[:10])}")
+            print(f"  Last 10 pages:  {summarize_latencies(latencies[-10:])}")
+        
+        # For comparison, load the whole timeline at once the way getNotices does
+        started = time.perf_counter()
+        total = len(list(query.stream()))
+        print(f"\nSingle unpaged query: {total} notices ({max(1, total)} reads) in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        print(f"Error benchmarking notice pagination: {e}")
+
 def add_notices(count=10):
     """Add dummy notices to Firestore"""
     try:
@@ -526,6 +826,54 @@ def generate_dummy_transactions():
     
     return transactions
 
+# Templates for randomly generated transactions (amounts are min/max ranges)
+TRANSACTION_TEMPLATES = [
+    {"title": "Monthly HOA Fees", "type": "TransactionType.fees", "amount": (4000.0, 6000.0), "isIncome": True,
+     "description": "Monthly HOA fees collection"},
+    {"title": "Special Assessment", "type": "TransactionType.fees", "amount": (5000.0, 15000.0), "isIncome": True,
+     "description": "Special assessment for capital works"},
+    {"title": "Clubhouse Rental", "type": "TransactionType.rental", "amount": (300.0, 1200.0), "isIncome": True,
+     "description": "Clubhouse rental for private event"},
+    {"title": "Pool Maintenance", "type": "TransactionType.maintenance", "amount": (200.0, 900.0), "isIncome": False,
+     "description": "Regular maintenance: Pool Maintenance"},
+    {"title": "Landscaping", "type": "TransactionType.maintenance", "amount": (600.0, 2000.0), "isIncome": False,
+     "description": "Regular maintenance: Landscaping"},
+    {"title": "Plumbing Repairs", "type": "TransactionType.maintenance", "amount": (300.0, 2500.0), "isIncome": False,
+     "description": "Regular maintenance: Plumbing Repairs"},
+    {"title": "Electricity", "type": "TransactionType.utilities", "amount": (600.0, 1300.0), "isIncome": False,
+     "description": "Electricity bill for common areas"},
+    {"title": "Water", "type": "TransactionType.utilities", "amount": (500.0, 1000.0), "isIncome": False,
+     "description": "Water bill for common areas"},
+    {"title": "Property Insurance", "type": "TransactionType.insurance", "amount": (2500.0, 4500.0), "isIncome": False,
+     "description": "Quarterly property insurance premium"},
+    {"title": "Management Fee", "type": "TransactionType.other", "amount": (1500.0, 2200.0), "isIncome": False,
+     "description": "Management Fee expense"},
+    {"title": "Legal Fees", "type": "TransactionType.other", "amount": (500.0, 3000.0), "isIncome": False,
+     "description": "Legal Fees expense"},
+]
+
+def generate_random_transactions(count, start, end):
+    """Generate a list of random transactions dated within the given range"""
+    transactions = []
+    
+    for _ in range(count):
+        template = random.choice(TRANSACTION_TEMPLATES)
+        date_value = random_time_between(start, end)
+        transactions.append({
+            "title": template["title"],
+            "type": template["type"],
+            "amount": round(random.uniform(*template["amount"]), 2),
+            "date": date_value,
+            "description": template["description"],
+            "isIncome": template["isIncome"],
+            "metadata": {
+                "createdAt": date_value,
+                "updatedAt": date_value
+            }
+        })
+    
+    return transactions
+
 def add_transactions():
     """Add dummy transactions to Firestore"""
     try:
@@ -543,6 +891,74 @@ def add_transactions():
         print(f"Error adding transactions: {e}")
         return 0
 
+###############################################
+# DOCUMENTS
+###############################################
+
+DOCUMENT_FOLDERS = ["Meeting Minutes", "Financial Reports", "Insurance", "Contracts", "Planning", "Newsletters"]
+
+# Document titles with their type (matching the lowercased Dart DocumentType names)
+DOCUMENT_FILES = [
+    ("AGM Minutes", "pdf"), ("Board Meeting Minutes", "pdf"), ("Annual Budget", "excel"),
+    ("Service Charge Statement", "excel"), ("Insurance Certificate", "pdf"), ("Maintenance Contract", "word"),
+    ("Site Photo", "image"), ("Planning Application", "pdf"), ("Newsletter", "word"), ("House Rules", "other"),
+]
+
+FILE_EXTENSIONS = {"pdf": "pdf", "excel": "xlsx", "word": "docx", "image": "jpg", "other": "txt"}
+
+def generate_auto_id():
+    """Generate a 20 character ID in the same format as Firestore auto IDs"""
+    return "".join(random.choices(string.ascii_letters + string.digits, k=20))
+
+def generate_dummy_documents(count, start, end):
+    """Generate a list of (document ID, document) pairs; folders get IDs so files can reference them"""
+    documents = []
+    folder_ids = []
+    
+    # Roughly one folder per ten files
+    folder_count = min(len(DOCUMENT_FOLDERS), count // 10)
+    for folder_name in random.sample(DOCUMENT_FOLDERS, folder_count):
+        created_at = random_time_between(start, end)
+        folder_id = generate_auto_id()
+        folder_ids.append(folder_id)
+        documents.append((folder_id, {
+            "name": folder_name,
+            "type": "folder",
+            "parentId": "root",
+            "size": 0,
+            "metadata": {
+                "createdAt": created_at,
+                "updatedAt": created_at
+            }
+        }))
+    
+    for _ in range(count - folder_count):
+        title, doc_type = random.choice(DOCUMENT_FILES)
+        created_at = random_time_between(start, end)
+        extension = FILE_EXTENSIONS[doc_type]
+        file_name = f"{title} {created_at:%Y-%m}.{extension}"
+        file_url = f"https://example.com/documents/{generate_auto_id()}.{extension}"
+        
+        document = {
+            "name": file_name,
+            "description": f"{title} uploaded {created_at:%d %B %Y}",
+            "type": doc_type,
+            "fileUrl": file_url,
+            # Files land in a folder most of the time when folders exist
+            "parentId": random.choice(folder_ids) if folder_ids and random.random() > 0.3 else "root",
+            "size": random.randint(10_000, 5_000_000),
+            "metadata": {
+                "createdAt": created_at,
+                "updatedAt": created_at
+            }
+        }
+        if doc_type == "image":
+            document["thumbnailUrl"] = file_url
+        
+        documents.append((None, document))
+    
+    return documents
+
 ###############################################
 # ESTATES
 ###############################################
@@ -584,6 +1000,45 @@ ADDRESSES = ["Park Avenue", "Main Street", "Oak Road", "Maple Drive", "Pine Lane
              "Garden Avenue", "Hill Road", "Meadow Lane", "River Drive", "Lake Road",
              "Forest Avenue", "Valley Lane", "Mountain View", "Sunset Drive", "Sunrise Lane"]
 
+# Extra name parts for generating large catalogues of unique estates
+ESTATE_NAME_QUALIFIERS = ["", "Upper", "Lower", "North", "South", "East", "West", "Old", "New"]
+ESTATE_NAME_ROOTS = ESTATE_NAME_PREFIXES + ["Ash", "Hazel", "Holly", "Rowan", "Alder", "Beech", "Larch", "Yew",
+                                            "Hawthorn", "Chestnut", "Laurel", "Heather", "Fern", "Ivy", "Clover",
+                                            "Sycamore", "Poplar", "Linden", "Juniper", "Moss"]
+ESTATE_NAME_ENDINGS = ["", "brook", "field", "wood", "dale", "mount", "haven", "ford", "glen", "vale",
+                       "gate", "bridge", "hurst", "lea", "more"]
+ESTATE_NAME_LONG_SUFFIXES = ESTATE_NAME_SUFFIXES + ["Close", "Crescent", "Lawns", "Rise", "Walk", "Drive",
+                                                    "Avenue", "Row", "Mews", "Downs", "Lodge"]
+MAX_HOUSE_NUMBER = 250
+
+def _build_estate(name, suffix, address, city, county):
+    """Build an estate document with a description and an optional logo"""
+    descriptions = [
+        f"A beautiful {suffix.lower()} community in the heart of {city}.",
+        f"Modern living in the prestigious {name} development.",
+        f"Experience luxury community living at {name}.",
+        f"A peaceful {suffix.lower()} retreat in {county}.",
+        f"Family-friendly community in the scenic area of {city}."
+    ]
+    
+    estate = {
+        "name": name,
+        "description": random.choice(descriptions),
+        "address": address,
+        "city": city,
+        "county": county,
+        "metadata": {
+            "createdAt": datetime.now(),
+            "updatedAt": datetime.now()
+        }
+    }
+    
+    # Add optional logo URL for some estates
+    if random.random() > 0.6:  # 40% chance to have a logo
+        estate["logoUrl"] = f"https://example.com/logos/{name.lower().replace(' ', '_')}.png"
+    
+    return estate
+
 def generate_dummy_estates(count=3):
     """Generate a list of dummy estates"""
     estates = []
@@ -599,40 +1054,46 @@ def generate_dummy_estates(count=3):
         city = random.choice(CITY_BY_COUNTY[county])
         address = f"{random.randint(1, 100)} {random.choice(ADDRESSES)}"
         
-        # Generate optional description
-        descriptions = [
-            f"A beautiful {suffix.lower()} community in the heart of {city}.",
-            f"Modern living in the prestigious {name} development.",
-            f"Experience luxury community living at {name}.",
-            f"A peaceful {suffix.lower()} retreat in {county}.",
-            f"Family-friendly community in the scenic area of {city}."
-        ]
-        
-        estate = {
-            "name": name,
-            "description": random.choice(descriptions),
-            "address": address,
-            "city": city,
-            "county": county,
-            "metadata": {
-                "createdAt": datetime.now(),
-                "updatedAt": datetime.now()
-            }
-        }
+        estates.append(_build_estate(name, suffix, address, city, county))
+    
+    return estates
+
+def generate_unique_estates(count):
+    """Generate estates whose names and locations (address and city) are all distinct"""
+    first_words = [root + ending for root in ESTATE_NAME_ROOTS for ending in ESTATE_NAME_ENDINGS]
+    suffixes = ESTATE_NAME_LONG_SUFFIXES
+    locations = [(city, county) for county in COUNTIES for city in CITY_BY_COUNTY[county]]
+    
+    name_space = len(ESTATE_NAME_QUALIFIERS) * len(first_words) * len(suffixes)
+    location_space = MAX_HOUSE_NUMBER * len(ADDRESSES) * len(locations)
+    if count > min(name_space, location_space):
+        raise ValueError(f"can generate at most {min(name_space, location_space)} unique estates")
+    
+    # Sample positions in the space of all combinations, so there are never any collisions to retry
+    name_indices = random.sample(range(name_space), count)
+    location_indices = random.sample(range(location_space), count)
+    
+    estates = []
+    for name_index, location_index in zip(name_indices, location_indices):
+        qualifier_index, rest = divmod(name_index, len(first_words) * len(suffixes))
+        word_index, suffix_index = divmod(rest, len(suffixes))
+        suffix = suffixes[suffix_index]
+        name = " ".join(filter(None, [ESTATE_NAME_QUALIFIERS[qualifier_index], first_words[word_index], suffix]))
         
-        # Add optional logo URL for some estates
-        if random.random() > 0.6:  # 40% chance to have a logo
-            estate["logoUrl"] = f"https://example.com/logos/{prefix.lower()}_{suffix.lower()}.png"
+        number_index, rest = divmod(location_index, len(ADDRESSES) * len(locations))
+        street_index, place_index = divmod(rest, len(locations))
+        city, county = locations[place_index]
+        address = f"{number_index + 1} {ADDRESSES[street_index]}"
         
-        estates.append(estate)
+        estates.append(_build_estate(name, suffix, address, city, county))
     
     return estates
 
-def add_estates(count=3):
+def add_estates(count=3, unique=False):
     """Add dummy estates to Firestore and optionally populate them with data"""
     try:
         collection_path = "estates"
-        estates = generate_dummy_estates(count)
+        estates = generate_unique_estates(count) if unique else generate_dummy_estates(count)
         
         created_estates = []
         for estate in estates:
@@ -671,15 +1132,478 @@ def setup_estate(estate_id_param, members_count=25, notices_count=10):
     
     print(f"Estate {estate_id} has been successfully set up with data!")
 
+###############################################
+# SCENARIOS
+###############################################
+
+# Firestore rejects batches with more than 500 writes or requests over 10 MiB, so leave some headroom
+FIRESTORE_BATCH_LIMIT = 500
+FIRESTORE_BATCH_BYTES = 9 * 1024 * 1024
+
+# Estate subcollections a scenario profile can populate, with their generators.
+# Each generator takes (count, start, end) and returns (document ID or None, document) pairs.
+SCENARIO_COLLECTIONS = {
+    "members": lambda count, start, end: [(m["email"], m) for m in generate_dummy_members(count)],
+    "notices": lambda count, start, end: [(None, n) for n in generate_dummy_notices(count, start, end)],
+    "transactions": lambda count, start, end: [(None, t) for t in generate_random_transactions(count, start, end)],
+    "documents": generate_dummy_documents,
+}
+
+# Keys a scenario profile may set
+SCENARIO_PROFILE_KEYS = {"name", "estates", "date_range", "notice_timeline", *SCENARIO_COLLECTIONS}
+
+def load_scenario(path):
+    """Load a scenario from a YAML or JSON file"""
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("PyYAML is required for YAML scenarios (pip install pyyaml), or use a JSON scenario")
+            scenario = yaml.safe_load(f)
+        else:
+            scenario = json.load(f)
+    
+    if not isinstance(scenario, dict) or not scenario.get("profiles"):
+        raise ValueError("scenario must define a non-empty 'profiles' list")
+    return scenario
+
+def _is_count(value):
+    # YAML `true` loads as a bool, which is also an int
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def validate_count(spec):
+    """Check a count distribution before any stage runs, raising ValueError if it is malformed"""
+    if _is_count(spec):
+        return
+    if not isinstance(spec, dict) or not set(spec) <= {"min", "max", "mean", "stddev"}:
+        raise ValueError(f"invalid count distribution: {spec!r}")
+    if any(key in spec and not _is_count(spec[key]) for key in ("min", "max")):
+        raise ValueError(f"count distribution min/max must be whole numbers of at least 0: {spec!r}")
+    if any(key in spec and not _is_number(spec[key]) for key in ("mean", "stddev")):
+        raise ValueError(f"count distribution mean/stddev must be numbers: {spec!r}")
+    if "mean" not in spec and not ("min" in spec and "max" in spec):
+        raise ValueError(f"count distribution needs a mean or both min and max: {spec!r}")
+    if "min" in spec and "max" in spec and spec["min"] > spec["max"]:
+        raise ValueError(f"count distribution min is greater than max: {spec!r}")
+
+def sample_count(spec):
+    """Sample a count from a distribution: a fixed number, {min, max} or {mean, stddev[, min, max]}"""
+    if isinstance(spec, int):
+        return spec
+    
+    if "mean" in spec:
+        value = round(random.gauss(spec["mean"], spec.get("stddev", 0)))
+        value = max(value, spec.get("min", 0))
+        if "max" in spec:
+            value = min(value, spec["max"])
+        return value
+    return random.randint(spec["min"], spec["max"])
+
+def resolve_date_range(spec, default=None, default_days=30):
+    """Resolve a {start, end} date range. Missing keys come from `default`, then from the last `default_days` days"""
+    spec = spec or {}
+    default_start, default_end = default or (None, None)
+    end = parse_date(spec["end"]) if spec.get("end") else default_end or datetime.now()
+    start = parse_date(spec["start"]) if spec.get("start") else default_start or end - timedelta(days=default_days)
+    if start >= end:
+        raise ValueError(f"date range start {start} must be before end {end}")
+    return start, end
+
+def _estimated_size(doc_id, data):
+    """Rough upper bound of a document's size in a commit request"""
+    return len(json.dumps(data, default=str)) + len(doc_id or "") + 100
+
+def commit_batches(collection_path, items, executor):
+    """Submit (document ID, document) pairs as batched writes to the shared executor.
+    Batches are cut by document count and by estimated size, so large documents stay under the request limit."""
+    collection = db.collection(collection_path)
+    futures = []
+    batch, batch_bytes = [], 0
+    for doc_id, data in items:
+        size = _estimated_size(doc_id, data)
+        if batch and (len(batch) >= FIRESTORE_BATCH_LIMIT or batch_bytes + size > FIRESTORE_BATCH_BYTES):
+            futures.append(executor.submit(_commit_batch, collection, batch))
+            batch, batch_bytes = [], 0
+        batch.append((doc_id, data))
+        batch_bytes += size
+    if batch:
+        futures.append(executor.submit(_commit_batch, collection, batch))
+    return futures
+
+def _commit_batch(collection, items):
+    batch = db.batch()
+    for doc_id, data in items:
+        doc_ref = collection.document(doc_id) if doc_id else collection.document()
+        batch.set(doc_ref, data)
+    batch.commit()
+    return len(items)
+
+def drain_batches(futures, limit=0):
+    """Wait until at most `limit` batches are outstanding; returns (documents written, outstanding futures)"""
+    written = 0
+    outstanding = list(futures)
+    while len(outstanding) > limit:
+        finished, not_done = wait(outstanding, return_when=FIRST_COMPLETED)
+        written += sum(future.result() for future in finished)
+        outstanding = list(not_done)
+    return written, outstanding
+
+def _estates_stage(profile, estates):
+    def run(context):
+        collection = db.collection("estates")
+        items = [(collection.document().id, estate) for estate in estates]
+        context["estates"][profile["name"]] = items
+        
+        written, _ = drain_batches(commit_batches("estates", items, context["executor"]))
+        return written
+    return run
+
+def _search_index_stage(context):
+    _, written = replace_search_index(context["executor"])
+    return written
+
+def _subcollection_stage(profile, collection, date_range):
+    def run(context):
+        generate = SCENARIO_COLLECTIONS[collection]
+        if collection == "notices" and profile.get("notice_timeline"):
+            generate = lambda count, start, end: [(None, n) for n in generate_notice_timeline(count, start, end)]
+        written = 0
+        outstanding = []
+        for parent_id, _ in context["estates"][profile["name"]]:
+            count = sample_count(profile[collection])
+            if count <= 0:
+                continue
+            items = generate(count, *date_range)
+            outstanding += commit_batches(f"estates/{parent_id}/{collection}", items, context["executor"])
+            # Keep generation from running far ahead of the writers
+            done, outstanding = drain_batches(outstanding, context["concurrency"] * 2)
+            written += done
+        done, _ = drain_batches(outstanding)
+        return written + done
+    return run
+
+def build_scenario_stages(scenario):
+    """Build the stage DAG for a scenario: one estates stage per profile, then one stage per subcollection
+    and, if requested, a search index stage over every estate"""
+    default_range = resolve_date_range(scenario.get("date_range"))
+    stages = []
+    names = set()
+    
+    for profile in scenario["profiles"]:
+        name = profile.get("name")
+        if not name or name in names:
+            raise ValueError(f"every profile needs a unique name (got {name!r})")
+        if not _is_count(profile.get("estates")) or profile["estates"] < 1:
+            raise ValueError(f"profile {name!r} must set 'estates' to a positive number")
+        unknown = set(profile) - SCENARIO_PROFILE_KEYS
+        if unknown:
+            raise ValueError(f"profile {name!r} has unknown keys: {', '.join(sorted(unknown))}")
+        for collection in SCENARIO_COLLECTIONS:
+            if collection in profile:
+                validate_count(profile[collection])
+        names.add(name)
+    
+    # Estate names and locations are drawn once for the whole scenario so they stay unique across profiles
+    estates = generate_unique_estates(sum(profile["estates"] for profile in scenario["profiles"]))
+    
+    for profile in scenario["profiles"]:
+        name = profile["name"]
+        date_range = resolve_date_range(profile.get("date_range"), default_range)
+        estates_stage = f"estates:{name}"
+        profile_estates, estates = estates[:profile["estates"]], estates[profile["estates"]:]
+        stages.append({"name": estates_stage, "deps": [], "run": _estates_stage(profile, profile_estates)})
+        
+        for collection in SCENARIO_COLLECTIONS:
+            if collection in profile:
+                stages.append({
+                    "name": f"{collection}:{name}",
+                    "deps": [estates_stage],
+                    "run": _subcollection_stage(profile, collection, date_range),
+                })
+    
+    if scenario.get("search_index"):
+        stages.append({
+            "name": "search_index",
+            "deps": [f"estates:{profile['name']}" for profile in scenario["profiles"]],
+            "run": _search_index_stage,
+        })
+    
+    return stages
+
+def _timed_stage(stage, context):
+    started = time.perf_counter()
+    written = stage["run"](context)
+    return written, time.perf_counter() - started
+
+def run_stage_dag(stages, concurrency=DEFAULT_CONCURRENCY):
+    """Run stages as soon as their dependencies finish, sharing one pool of batch writers"""
+    context = {"executor": ThreadPoolExecutor(max_workers=concurrency), "concurrency": concurrency, "estates": {}}
+    pending = {stage["name"]: stage for stage in stages}
+    running = {}
+    done, failed = set(), set()
+    total_written = 0
+    started = time.perf_counter()
+    
+    # Stages mostly wait on the shared writers, so each gets its own lightweight thread
+    with ThreadPoolExecutor(max_workers=len(stages)) as stage_pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if any(dep in failed for dep in stage["deps"]):
+                    print(f"Skipping stage {name}: a dependency failed")
+                    failed.add(name)
+                    del pending[name]
+                elif all(dep in done for dep in stage["deps"]):
+                    print(f"Starting stage {name}")
+                    running[stage_pool.submit(_timed_stage, stage, context)] = name
+                    del pending[name]
+            
+            if not running:
+                # Anything still pending depends on a stage that does not exist
+                for name in pending:
+                    print(f"Skipping stage {name}: unresolved dependencies")
+                failed.update(pending)
+                break
+            
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    written, elapsed = future.result()
+                    total_written += written
+                    done.add(name)
+                    print(f"Finished stage {name}: {written} documents in {elapsed:.1f}s")
+                except Exception as e:
+                    failed.add(name)
+                    print(f"Error in stage {name}: {e}")
+    
+    context["executor"].shutdown()
+    elapsed = time.perf_counter() - started
+    print(f"\nWrote {total_written} documents in {elapsed:.1f}s ({total_written / max(elapsed, 1e-9):.0f} docs/s)")
+    print(f"{len(done)} stages succeeded, {len(failed)} failed")
+    return done, failed
+
+def run_scenario(path, concurrency=None):
+    """Load a scenario file and run its stage DAG; returns True if every stage succeeded"""
+    try:
+        scenario = load_scenario(path)
+        stages = build_scenario_stages(scenario)
+        if concurrency is None:
+            concurrency = scenario.get("concurrency", DEFAULT_CONCURRENCY)
+        if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency < 1:
+            raise ValueError(f"concurrency must be a positive whole number (got {concurrency!r})")
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"ERROR: Invalid scenario {path}: {e}")
+        return False
+    
+    print(f"Running scenario {scenario.get('name', path)}: {len(stages)} stages, concurrency {concurrency}")
+    _, failed = run_stage_dag(stages, concurrency)
+    return not failed
+
+###############################################
+# SEARCH INDEX
+###############################################
+
+# Each index document holds the IDs of the estates whose name, city or county has a word starting
+# with its prefix, sorted by estate name. Large prefixes are split across shards of up to
+# SEARCH_SHARD_SIZE IDs (about 50 KB each). Lookups load only the first page of matching estates.
+SEARCH_INDEX_COLLECTION = "estate_search_index"
+SEARCH_PREFIX_MIN_LENGTH = 2
+SEARCH_PREFIX_MAX_LENGTH = 16
+SEARCH_SHARD_SIZE = 2000
+SEARCH_RESULTS_PAGE_SIZE = 20
+
+def search_tokens(text):
+    """Split text into lowercase words with accents removed (e.g. "Dún Laoghaire" -> ["dun", "laoghaire"])"""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+def search_index_key(token):
+    """Return the index document prefix for a query word, or None if it is too short to look up"""
+    if len(token) < SEARCH_PREFIX_MIN_LENGTH:
+        return None
+    return token[:SEARCH_PREFIX_MAX_LENGTH]
+
+def build_estate_search_index(estates):
+    """Build sharded index documents from (estate ID, estate) pairs; returns (document ID, document) pairs"""
+    postings = {}
+    for estate_id_value, estate in estates:
+        entry = (estate["name"], estate_id_value)
+        prefixes = set()
+        for token in search_tokens(" ".join([estate["name"], estate["city"], estate["county"]])):
+            max_length = min(len(token), SEARCH_PREFIX_MAX_LENGTH)
+            prefixes.update(token[:length] for length in range(SEARCH_PREFIX_MIN_LENGTH, max_length + 1))
+        for prefix in prefixes:
+            postings.setdefault(prefix, []).append(entry)
+    
+    documents = []
+    for prefix, entries in postings.items():
+        ids = [estate_id_value for _, estate_id_value in sorted(entries)]
+        shards = (len(ids) + SEARCH_SHARD_SIZE - 1) // SEARCH_SHARD_SIZE
+        for shard in range(shards):
+            documents.append((f"{prefix}_{shard}", {
+                "prefix": prefix,
+                "shard": shard,
+                "shards": shards,
+                "total": len(ids),
+                "ids": ids[shard * SEARCH_SHARD_SIZE:(shard + 1) * SEARCH_SHARD_SIZE],
+            }))
+    
+    return documents
+
+def _delete_search_index():
+    collection = db.collection(SEARCH_INDEX_COLLECTION)
+    count = 0
+    batch = db.batch()
+    for doc in collection.stream():
+        batch.delete(doc.reference)
+        count += 1
+        if count % FIRESTORE_BATCH_LIMIT == 0:
+            batch.commit()
+            batch = db.batch()
+    batch.commit()
+    return count
+
+def clear_search_index():
+    """Delete every estate search index document"""
+    try:
+        count = _delete_search_index()
+        print(f"Successfully cleared {count} search index documents!")
+        return count
+    except Exception as e:
+        print(f"Error clearing search index: {e}")
+        return 0
+
+def replace_search_index(executor):
+    """Replace the search index with one built from every estate in Firestore.
+    Returns (estates indexed, index documents written)."""
+    estates = [(doc.id, doc.to_dict()) for doc in db.collection("estates").stream()]
+    documents = build_estate_search_index(estates)
+    
+    # Clear first so that no prefix keeps entries from an older build
+    _delete_search_index()
+    written, _ = drain_batches(commit_batches(SEARCH_INDEX_COLLECTION, documents, executor))
+    return len(estates), written
+
+def rebuild_search_index(concurrency=DEFAULT_CONCURRENCY):
+    """Rebuild the estate search index from every estate in Firestore"""
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            indexed, written = replace_search_index(executor)
+        
+        print(f"Successfully indexed {indexed} estates into {written} search index documents!")
+        return written
+    except Exception as e:
+        print(f"Error building search index: {e}")
+        return 0
+
+def _get_index_shards(doc_ids):
+    """Fetch index documents in a single round trip, returned in the order requested"""
+    collection = db.collection(SEARCH_INDEX_COLLECTION)
+    snapshots = {snapshot.id: snapshot for snapshot in db.get_all([collection.document(i) for i in doc_ids])}
+    return [snapshots[doc_id] for doc_id in doc_ids]
+
+def search_estates_indexed(query):
+    """Look up estates through the search index; returns (matching estate IDs, documents read).
+    
+    Every query word must prefix-match a word of the estate's name, city or county. The first
+    page of matching estates is loaded too, since the app needs them to show results.
+    """
+    tokens = search_tokens(query)
+    keys = list(dict.fromkeys(search_index_key(token) for token in tokens))
+    if not tokens or None in keys:
+        return None, 0
+    
+    # The first shard of every word says how many shards it has; then fetch the rest together
+    first_shards = _get_index_shards([f"{key}_0" for key in keys])
+    reads = len(first_shards)
+    if not all(shard.exists for shard in first_shards):
+        return [], reads
+    
+    first_shards = sorted((shard.to_dict() for shard in first_shards), key=lambda shard: shard["total"])
+    remaining = [f"{shard['prefix']}_{number}" for shard in first_shards for number in range(1, shard["shards"])]
+    ids_by_prefix = {shard["prefix"]: list(shard["ids"]) for shard in first_shards}
+    if remaining:
+        for snapshot in _get_index_shards(remaining):
+            shard = snapshot.to_dict()
+            ids_by_prefix[shard["prefix"]] += shard["ids"]
+        reads += len(remaining)
+    
+    # Intersect starting from the rarest word, keeping its name order
+    matches = ids_by_prefix[first_shards[0]["prefix"]]
+    for shard in first_shards[1:]:
+        other = set(ids_by_prefix[shard["prefix"]])
+        matches = [estate_id_value for estate_id_value in matches if estate_id_value in other]
+    
+    page = matches[:SEARCH_RESULTS_PAGE_SIZE]
+    if page:
+        collection = db.collection("estates")
+        reads += len(list(db.get_all([collection.document(estate_id_value) for estate_id_value in page])))
+    
+    return matches, reads
+
+def search_estates_load_all(query):
+    """Search the way EstateSearchProvider does: load every estate and filter client-side"""
+    estates = [doc.to_dict() for doc in db.collection("estates").stream()]
+    query = query.lower().strip()
+    results = [
+        estate for estate in estates
+        if query in estate.get("name", "").lower()
+        or query in (estate.get("address") or "").lower()
+        or query in (estate.get("description") or "").lower()
+    ]
+    return results, len(estates)
+
+def benchmark_estate_search(queries, repeats=3):
+    """Compare indexed estate lookup against loading every estate, reporting latency and documents read"""
+    for query in queries:
+        print(f"\nQuery: {query!r}")
+        for label, search in [("load all", search_estates_load_all), ("indexed", search_estates_indexed)]:
+            latencies = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                results, reads = search(query)
+                latencies.append(time.perf_counter() - started)
+            
+            if results is None:
+                print(f"  {label:>8}: every word needs at least {SEARCH_PREFIX_MIN_LENGTH} characters to use the index")
+                continue
+            print(f"  {label:>8}: {len(results)} results, {reads} reads per search, {summarize_latencies(latencies)}")
+
 ###############################################
 # MAIN EXECUTION
 ###############################################
 
 if __name__ == "__main__":
+    # Scenarios describe their own estates, so they don't take an estate_id
+    if args.scenario:
+        exit(0 if run_scenario(args.scenario, args.concurrency) else 1)
+    
+    # The search index covers all estates, so it doesn't take an estate_id either
+    if args.type == "search_index":
+        if args.action == "benchmark":
+            print("Error: --action benchmark is only supported with --type estates or --type notices")
+            print("Use: python generate_data.py --type=estates --action=benchmark to benchmark estate search")
+            exit(1)
+        if args.action == "clear":
+            clear_search_index()
+        else:
+            rebuild_search_index(args.concurrency or DEFAULT_CONCURRENCY)
+        exit(0)
+    
     # Handle the estates generation case separately since it doesn't require an estate_id
     if args.type == "estates":
+        if args.action == "benchmark":
+            benchmark_estate_search([query.strip() for query in args.queries.split(",") if query.strip()],
+                                    args.repeats)
+            exit(0)
+        
         count = args.estates_count if args.estates_count > 0 else 3
-        created_estates = add_estates(count)
+        created_estates = add_estates(count, args.unique_names)
         if len(created_estates) > 0 and args.count > 0:
             # If estates were created and user specified a count for other data, generate data for the first estate
             first_estate_id = created_estates[0][0]
@@ -687,6 +1611,10 @@ if __name__ == "__main__":
             setup_estate(first_estate_id, args.count, args.count)
         exit(0)
     
+    if args.action == "benchmark" and args.type != "notices":
+        print("Error: --action benchmark is only supported with --type estates or --type notices")
+        exit(1)
+    
     # For all other operations, an estate_id is required
     if not estate_id:
         print("Error: --estate_id is required for operations other than creating estates")
@@ -695,7 +1623,9 @@ if __name__ == "__main__":
         
     print(f"Working with estate ID: {estate_id}")
     
-    if args.action == "clear":
+    if args.action == "benchmark":
+        benchmark_notice_pagination(args.page_size, args.repeats)
+    elif args.action == "clear":
         if args.type == "all" or args.type == "transactions":
             clear_transactions()
         if args.type == "all" or args.type == "notices":
@@ -710,7 +1640,16 @@ if __name__ == "__main__":
         else:
             if args.type == "transactions":
                 add_transactions()
-            if args.type == "notices":
+            if args.type == "notices" and args.timeline:
+                try:
+                    start, end = resolve_date_range({"start": args.start_date, "end": args.end_date},
+                                                    default_days=730)
+                except ValueError as e:
+                    print(f"Error: invalid timeline dates: {e}")
+                    exit(1)
+                count = args.count if args.count > 0 else 5000
+                add_notice_timeline(count, start, end, args.concurrency or DEFAULT_CONCURRENCY)
+            elif args.type == "notices":
                 count = args.count if args.count > 0 else 10
                 add_notices(count)
             if args.type == "members":